@@ -8,6 +8,26 @@ from ..exceptions import (
     InvalidDataError,
 )
 
+# === utils ===
+# Unrolled multiply kernels for tiny shapes, generated once per (m, k, n)
+_SMALL_MATMUL_LIMIT = 4
+_SMALL_MATMUL = {}
+
+def _gen_matmul(m, k, n):
+    """Generate an unrolled ``f(A, B) -> list[list]`` for an m×k · k×n product."""
+    lines = ['def f(A, B):', '    return [']
+    for i in range(m):
+        entries = ', '.join(
+            '+'.join(f'A[{i}][{r}]*B[{r}][{j}]' for r in range(k))
+            for j in range(n)
+        )
+        lines.append(f'        [{entries}],')
+    lines.append('    ]')
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['f']
+
+
 class BinaryMatrixOperationsMixin:
     def matrix_addition(self, other: Self) -> Self:
         """Matrix-matrix addition.
@@ -31,11 +51,9 @@ class BinaryMatrixOperationsMixin:
         self._validate_other_type(other, operation=operation)
         self._validate_same_size(other, operation=operation, reason="Matrices have different dimensions")
 
-        rows, cols = self.rows, self.cols
         return self.__class__([
-             [self[row,col] + other[row,col] 
-              for col in range(1, cols+1)]
-              for row in range(1, rows+1)
+             [a + b for a, b in zip(row_s, row_o)]
+              for row_s, row_o in zip(self._data, other._data)
         ])
 
     def scalar_addition(self, scalar: Any) -> Self:
@@ -54,11 +72,12 @@ class BinaryMatrixOperationsMixin:
             ``__radd__``: Supports ``s + A`` using Python's addition.
         """
         # chek scalar
-        rows, cols = self.rows, self.cols
+        if isinstance(scalar, int | float | complex) and scalar == 0:
+            return self.__class__(self._data)
+
         return self.__class__([
-             [scalar + self[row,col]
-              for col in range(1, cols+1)] 
-              for row in range(1, rows+1)
+             [scalar + a for a in row]
+              for row in self._data
         ])
 
     def matrix_multiplication(self, other: Self) -> Self:
@@ -91,10 +110,21 @@ class BinaryMatrixOperationsMixin:
         
         self_rows, other_cols = self.rows, other.cols
         k = self.cols
+
+        # tiny shapes (graphics/physics workloads) use an unrolled kernel
+        if self_rows <= _SMALL_MATMUL_LIMIT and k <= _SMALL_MATMUL_LIMIT and other_cols <= _SMALL_MATMUL_LIMIT:
+            shape = (self_rows, k, other_cols)
+            kernel = _SMALL_MATMUL.get(shape)
+            if kernel is None:
+                kernel = _SMALL_MATMUL[shape] = _gen_matmul(*shape)
+            return self.__class__(kernel(self._data, other._data))
+
+        # transpose other once so each dot product walks two plain lists
+        other_T = list(zip(*other._data))
         return self.__class__([
-            [sum(self[i,r]*other[r,j] for r in range(1, k+1))
-             for j in range(1, other_cols+1)] 
-             for i in range(1, self_rows+1)
+            [sum(a*b for a, b in zip(row, col))
+             for col in other_T]
+             for row in self._data
         ])
 
     def scalar_multiplication(self, scalar: Any) -> Self:
@@ -114,11 +144,15 @@ class BinaryMatrixOperationsMixin:
 
         """
         # chek scalar
-        rows, cols = self.rows, self.cols
+        if isinstance(scalar, int | float | complex):
+            if scalar == 1:
+                return self.__class__(self._data)
+            if scalar == 0:
+                return type(self).O(self.rows, self.cols)
+
         return self.__class__([
-             [scalar * self[row,col]
-              for col in range(1, cols+1)] 
-              for row in range(1, rows+1)
+             [scalar * a for a in row]
+              for row in self._data
         ])
 
     def matrix_exponentiation(self, exponent: int) -> Self:
@@ -206,12 +240,10 @@ class BinaryMatrixOperationsMixin:
         operation="hadamard_product"
         self._validate_other_type(other, operation=operation)
         self._validate_same_size(other, operation=operation, reason="Matrices have different dimensions")
-        
-        rows, cols = self.rows, self.cols
+
         return self.__class__([
-             [self[row,col] * other[row,col]
-              for col in range(1, cols+1)] 
-              for row in range(1, rows+1)
+             [a * b for a, b in zip(row_s, row_o)]
+              for row_s, row_o in zip(self._data, other._data)
         ])
 
     def kronecker_product(self, other: Self) -> Self:
@@ -229,14 +261,14 @@ class BinaryMatrixOperationsMixin:
         operation="kronecker_product"
         self._validate_other_type(other, operation=operation)
 
-        self_rows, self_cols = self.rows, self.cols
-        other_rows, other_cols = other.rows, other.cols
-        return self.__class__([
-            [self[r, s] * other[v, w]
-             for s in range(1, self_cols+1)
-             for w in range(1, other_cols+1)]
-             for r in range(1, self_rows+1)
-             for v in range(1, other_rows+1)
+        # iterate the stored rows directly; each block row is every entry of
+        # a row of A scaled across a row of B
+        return type(self)._unchecked([
+            [a * b
+             for a in row_a
+             for b in row_b]
+             for row_a in self._data
+             for row_b in other._data
             ])
 
     def map(self, func: Callable[[Any], Any]) -> Self:
@@ -248,11 +280,9 @@ class BinaryMatrixOperationsMixin:
         Returns:
             Self: New matrix where each entry is ``func(self[i, j])``.
         """
-        rows, cols = self.rows, self.cols
         return self.__class__([
-             [func(self[row,col])
-              for col in range(1, cols+1)] 
-              for row in range(1, rows+1)
+             [func(entry) for entry in row]
+              for row in self._data
         ])
 
     def augment(self, other: Self) -> Self:
@@ -262,8 +292,8 @@ class BinaryMatrixOperationsMixin:
         if self.rows != other.rows:
             raise InvalidDimensionsError(self, other, operation=op, reason="Matrices do not have the same number of rows")
 
-        return self.__class__([
-             [self[i,j] if j<=self.cols else other[i,j-self.cols] 
-              for j in range(1, self.cols+other.cols+1)]
-              for i in range(1, self.rows+1)
+        # one C-level concatenation per row pair
+        return type(self)._unchecked([
+             row_s + row_o
+             for row_s, row_o in zip(self._data, other._data)
         ])
\ No newline at end of file
@@ -3,6 +3,31 @@ from ..exceptions import (
     InvalidDataError,
 )
 
+
+# === utils ===
+# One fused comparison kernel: the difference is computed once per cell
+# and a tagged predicate decides the boolean.
+_CMP_PREDICATES = {
+    "eq": lambda d, tol, _abs=abs: _abs(d) <= tol,
+    "ne": lambda d, tol, _abs=abs: _abs(d) > tol,
+    "lt": lambda d, tol: d < -tol,
+    "gt": lambda d, tol: d > tol,
+    "le": lambda d, tol: d <= tol,
+    "ge": lambda d, tol: d >= -tol,
+}
+
+def _cmp_kernel(sd, od, pred, tol):
+    # preallocate each output row in one fill; no append-and-grow
+    cols = len(sd[0])
+    out = [None]*len(sd)
+    for i, (row_s, row_o) in enumerate(zip(sd, od)):
+        out_row = [False]*cols
+        for j, (a, b) in enumerate(zip(row_s, row_o)):
+            out_row[j] = pred(a - b, tol)
+        out[i] = out_row
+    return out
+
+
 class BooleanLogicMixin:
     # === NoName ===
     def elementwise_OR(self, other):
@@ -11,8 +36,8 @@ class BooleanLogicMixin:
         is the logical disjunction (also known as Logical OR or logical addition) 
         of the corresponding entry in self and other.
         """
-        if self._have_same_size(other):
-            raise InvalidDimensionsError(self, other, 
+        if not self._have_same_size(other):
+            raise InvalidDimensionsError(self, other,
                 operation="elementwise OR",
                 reason="Matrices have different dimensions"
             )
@@ -21,9 +46,8 @@ class BooleanLogicMixin:
                 "Cannot perform logical disjunction (Logical OR) on non-boolean matrices"
             )
         return self.__class__([
-            [not self.data[row][col] or other.data[row][col]
-             for col in range(self.cols)]
-            for row in range(self.rows)
+            [a or b for a, b in zip(row_s, row_o)]
+            for row_s, row_o in zip(self._data, other._data)
         ])
     
     def elementwise_AND(self, other):
@@ -32,8 +56,8 @@ class BooleanLogicMixin:
         is the logical conjunction (also known as Logical AND or logical multiplication) 
         of the corresponding entry in self and other.
         """
-        if self._have_same_size(other):
-            raise InvalidDimensionsError(self, other, 
+        if not self._have_same_size(other):
+            raise InvalidDimensionsError(self, other,
                 operation="elementwise AND",
                 reason="Matrices have different dimensions"
             )
@@ -42,9 +66,8 @@ class BooleanLogicMixin:
                 "Cannot perform logical conjunction (Logical AND) on non-boolean matrices"
             )
         return self.__class__([
-            [not self.data[row][col] and other.data[row][col]
-             for col in range(self.cols)]
-            for row in range(self.rows)
+            [a and b for a, b in zip(row_s, row_o)]
+            for row_s, row_o in zip(self._data, other._data)
         ])
     
     def elementwise_NOT(self):
@@ -52,17 +75,24 @@ class BooleanLogicMixin:
         Returns a new boolean Matrix where each entry
         is the negation of the corresponding entry in self.
         """
-        if not all([isinstance(value, bool) for row in self.data for value in row]):
+        if not self._is_boolean_matrix():
             raise InvalidDataError(
                 "Cannot perform logical NOT on non-boolean matrix"
             )
         return self.__class__([
-            [not self(i, j)
-             for j in range(self.cols)]
-            for i in range(self.rows)
+            [not entry for entry in row]
+            for row in self._data
         ])
 
     # === Elementwise comparisons ===
+    def _cmp(self, other, tag, tol, *, operation):
+        self._validate_other_type(other, operation=operation)
+        self._validate_same_size(other, operation=operation)
+
+        # read the class attribute directly; skips type(self) + classmethod dispatch
+        tol = self._eps if tol is None else tol
+        return self.__class__(_cmp_kernel(self._data, other._data, _CMP_PREDICATES[tag], tol))
+
     def elementwise_equal(self, other, *, tol=None):
         """Test elementwise equality with tolerance.
 
@@ -81,17 +111,7 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise equality"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [abs(self[i, j] - other[i, j]) <= tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "eq", tol, operation="elementwise equality")
 
     def elementwise_not_equal(self, other, *, tol=None):
         """Test elementwise inequality with tolerance.
@@ -111,17 +131,7 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise inequality"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [abs(self[i, j] - other[i, j]) > tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "ne", tol, operation="elementwise inequality")
 
     def elementwise_less_than(self, other, *, tol=None):
         """Test elementwise strict less-than with tolerance.
@@ -141,17 +151,7 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise less than"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [self[i, j] - other[i, j] < -tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "lt", tol, operation="elementwise less than")
 
     def elementwise_greater_than(self, other, *, tol=None):
         """Test elementwise strict greater-than with tolerance.
@@ -171,17 +171,7 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise greater than"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [self[i, j] - other[i, j] > tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "gt", tol, operation="elementwise greater than")
 
     def elementwise_less_than_or_equal(self, other, *, tol=None):
         """Test elementwise less-than-or-equal with tolerance.
@@ -200,17 +190,7 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise less than or equal"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [self[i, j] - other[i, j] <= tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "le", tol, operation="elementwise less than or equal")
 
     def elementwise_greater_than_or_equal(self, other, *, tol=None):
         """Test elementwise greater-than-or-equal with tolerance.
@@ -229,15 +209,5 @@ class BooleanLogicMixin:
             InvalidDataError: If ``other`` is not the same matrix type as ``self``.
             InvalidDimensionsError: If the matrices have different dimensions.
         """
-        op = "elementwise greater than or equal"
-        self._validate_other_type(other, operation=op)
-        self._validate_same_size(other, operation=op)
-
-        tol = type(self).eps() if tol is None else tol
-        rows, cols = self.rows, self.cols
-        return self.__class__([
-            [self[i, j] - other[i, j] >= -tol 
-             for j in range(1, cols+1)]
-             for i in range(1, rows+1)
-        ])
+        return self._cmp(other, "ge", tol, operation="elementwise greater than or equal")
     
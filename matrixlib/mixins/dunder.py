@@ -7,6 +7,9 @@ from ..exceptions import (
     MatrixValueError,
 )
 
+# instance-level memo keys dropped whenever an entry is assigned
+_INSTANCE_CACHES = ('_is_integer_cache', '_det_cache', '_adj_cache', '_inv_cache', '_lu_cache', '_minor_cache')
+
 class DunderMixin:
     # === Indexing & Callable Access ===
     def __getitem__(self, key: tuple[int | slice, int | slice]) -> Any | Self: # matrix[key]
@@ -30,9 +33,9 @@ class DunderMixin:
         
         if isinstance(key[0], int) and isinstance(key[1], int):
             i, j = key
-            if i not in range(1, self.rows+1):
+            if not 1 <= i <= self.rows:
                 raise IndexOutOfBoundsError(self, i, axis='row', operation='Matrix.__getitem__', reason='The first index is out of bounds')
-            if j not in range(1, self.cols+1):
+            if not 1 <= j <= self.cols:
                 raise IndexOutOfBoundsError(self, j, axis='col', operation='Matrix.__getitem__', reason='The second index is out of bounds')
             
             return self._data[i-1][j-1] # convert from input 1-based to internal 0-based
@@ -77,13 +80,19 @@ class DunderMixin:
         if not len(idx) == 2:
             raise InvalidShapeError(idx, (2,), operation='Matrix.__getitem__')
         i, j = idx
-        if (i-1) not in range(self.rows):
+        if not 1 <= i <= self.rows:
             raise IndexOutOfBoundsError(self, i, axis = 'row', operation='Matrix.__setitem__', reason='The first index is out of bounds')
-        if (j-1) not in range(self.cols):
+        if not 1 <= j <= self.cols:
             raise IndexOutOfBoundsError(self, j, axis = 'col', operation='Matrix.__setitem__', reason='The second index is out of bounds')
         
-        # convert from input 1-based to internal 0-based
-        self._data[i-1][j-1] = entry
+        # convert from input 1-based to internal 0-based.
+        # copy-on-write: rows may be structurally shared with matrices
+        # returned by the elementary row operations
+        row = self._data[i-1][:]
+        row[j-1] = entry
+        self._data[i-1] = row
+        for key in _INSTANCE_CACHES:
+            self.__dict__.pop(key, None)
 
 
     def __call__(self, i, j): # to be removed
@@ -127,20 +136,21 @@ class DunderMixin:
 
     # === arithmetic operators ===
     def __add__(self, other: Self | Any) -> Self: # +
-        if isinstance(other, self.__class__):
+        # "type(...) is" is a single pointer compare; isinstance only runs for subclasses
+        if type(other) is self.__class__ or isinstance(other, self.__class__):
             return self.matrix_addition(other)
         return self.scalar_addition(other)
-        
+
     def __sub__(self, other: Self | Any) -> Self: # -
         return self + -other
 
     def __mul__(self, other: Self | Any) -> Self: # *
-        if isinstance(other, self.__class__):
+        if type(other) is self.__class__ or isinstance(other, self.__class__):
             return self.matrix_multiplication(other)
         return self.scalar_multiplication(other)
 
     def __truediv__(self, other: Self | Any) -> Self: # /
-        if isinstance(other, self.__class__):
+        if type(other) is self.__class__ or isinstance(other, self.__class__):
             return self * other.inv
         return self * (1/other)
 
@@ -166,8 +176,8 @@ class DunderMixin:
         return self.__add__(other)
 
     def __rmul__(self, other: Self | Any) -> Self: # scaler * Matrix
-        if not isinstance(other, self.__class__):
-            return self.__mul__(other)
+        # matrix * matrix is always handled by __mul__, so other is a scalar here
+        return self.scalar_multiplication(other)
 
     def __rpow__(self, other: Any) -> Self: # scaler ** Matrix
         return self.scalar_exponentiation(other)
@@ -1,8 +1,11 @@
 from typing import Self, Any
 
+from .unary_operations import _lu_solve_columns
 from ..exceptions import (
     InvalidDataError,
     IndexOutOfBoundsError,
+    InvalidDimensionsError,
+    SingularMatrixError,
 )
 
 class ElementaryOperationsMixin:
@@ -28,15 +31,13 @@ class ElementaryOperationsMixin:
             raise InvalidDataError(obj=i, expected_type='int', operation='row switching', reason='The first input has not type: "int"')
         if not isinstance(j, int):
             raise InvalidDataError(obj=j, expected_type='int', operation='row switching', reason='The second input has not type: "int"')
-        if (i-1) not in range(self.rows) or (j-1) not in range(self.rows):
+        if not 1 <= i <= self.rows or not 1 <= j <= self.rows:
             raise IndexOutOfBoundsError(matrix=self, index=(i, j), operation='row switching', reason='At least one of the indices is out of bounds')
 
-        return self.__class__([
-            self._data[i-1] if idx == j-1 else 
-            self._data[j-1] if idx == i-1 else 
-            row[:] 
-            for idx, row in enumerate(self._data)
-        ])
+        # untouched rows are shared; __setitem__ copies-on-write, so this is safe
+        data = list(self._data)
+        data[i-1], data[j-1] = data[j-1], data[i-1]
+        return type(self)._unchecked(data)
 
     def row_multiplication(self, i: int, k: Any=1) -> Self:
         """
@@ -56,16 +57,14 @@ class ElementaryOperationsMixin:
         """
         if not isinstance(i, int):
             raise InvalidDataError(obj=i, expected_type='int', operation='row multiplication', reason='The index input has an invalid type')
-        if (i-1) not in range(self.rows):
+        if not 1 <= i <= self.rows:
             raise IndexOutOfBoundsError(matrix=self, index=i, operation='row multiplication')
         if abs(k) < 1e-8:
             raise ValueError('Can not multiply row with 0')
 
-        return self.__class__([
-            [k*a for a in self._data[i-1]] if idx == i-1 else 
-            row[:] 
-            for idx, row in enumerate(self._data)
-        ])
+        data = list(self._data)
+        data[i-1] = [k*a for a in data[i-1]]
+        return type(self)._unchecked(data)
 
     def row_addition(self, i: int, j: int, k: Any=1) -> Self:
         """
@@ -87,14 +86,13 @@ class ElementaryOperationsMixin:
             raise InvalidDataError(obj=i, expected_type='int', operation='row addition', reason='The first input has an invalid type')
         if not isinstance(j, int):
             raise InvalidDataError(obj=j, expected_type='int', operation='row addition', reason='The second input has an invalid type')
-        if (i-1) not in range(self.rows) or (j-1) not in range(self.rows):
+        if not 1 <= i <= self.rows or not 1 <= j <= self.rows:
             raise IndexOutOfBoundsError(matrix=self, index=(i, j), operation='row addition')
         
-        return self.__class__([
-            [self._data[i-1][idx]+k*self._data[j-1][idx] for idx in range(self.cols)] 
-            if row == self._data[i-1] else row[:] 
-            for row in self._data
-        ])
+        data = list(self._data)
+        src_i, src_j = data[i-1], data[j-1]
+        data[i-1] = [a+k*b for a, b in zip(src_i, src_j)]
+        return type(self)._unchecked(data)
     
     # === Elementary Column Operations ===
     def column_switching(self, i: int, j: int) -> Self:
@@ -125,7 +123,7 @@ class ElementaryOperationsMixin:
                     break
 
             if find_pivot:
-                for i in range(1, self.rows+1):
+                for i in range(1, rows+1):
                     if i == pivot:
                         continue
                     M = M.row_addition(i, pivot, -M[i,j])
@@ -158,9 +156,48 @@ class ElementaryOperationsMixin:
 
 
     def solve(self, other: Self) -> Self | None:
+        """
+        Solve the linear system ``A·X = B`` where ``A`` is this matrix.
+
+        Square numeric systems reuse the cached LU factorization and run one
+        forward/back substitution per column of ``B`` — cheaper and more
+        stable than forming ``A⁻¹`` explicitly. Other systems fall back to
+        Gauss-Jordan elimination on the augmented matrix.
+
+        Args:
+            other (Matrix): Right-hand side ``B`` with the same number of rows.
+
+        Returns:
+            Matrix | None: The solution ``X``, or ``None`` when the fallback
+            path finds no unique solution.
+
+        Raises:
+            InvalidDataError: If ``other`` is not a matrix.
+            InvalidDimensionsError: If ``other`` has a different number of rows.
+            SingularMatrixError: If a square numeric system is singular.
+        """
+        op = 'solve'
+        self._validate_other_type(other, operation=op)
+        if self.rows != other.rows:
+            raise InvalidDimensionsError(self, other, operation=op, reason='Matrices do not have the same number of rows')
+
+        if self._is_square() and self._is_numeric_matrix() and other._is_numeric_matrix():
+            factored = self._lu_cached()
+            if factored is None:
+                raise SingularMatrixError(matrix=self, operation=op)
+            lower, upper, perm, _ = factored
+            rhs_columns = [list(col) for col in zip(*other._data)]
+            solution_columns = _lu_solve_columns(lower, upper, perm, rhs_columns)
+            return self.__class__([list(row) for row in zip(*solution_columns)])
+
+        # general path: reduce the augmented system; a unique solution shows
+        # up as an identity block on the left
         M = self.augment(other).RREF
+        left = M.submatrix(list(range(1, M.rows+1)), list(range(1, self.cols+1)))
+        if self._is_square() and left._triple_equal(type(self).identity(self.cols)):
+            return M.submatrix(list(range(1, M.rows+1)), list(range(self.cols+1, M.cols+1)))
+        return None
 
-        
 
     # === Aliases ===
     RREF = property(reduced_row_echelon_form)
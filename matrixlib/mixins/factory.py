@@ -1,12 +1,42 @@
-from math import sqrt, exp, pi
+from cmath import exp
+from math import sqrt, pi
 from typing import Self, Any
 
 from ..exceptions import (
     InvalidDataError,
+    IndexOutOfBoundsError,
     MatrixValueError,
 )
 
+def _validate_positive_int(value: Any, name: str, operation: str) -> None:
+    """Shared dimension check for the factory methods.
+
+    Exact ``type(...) is int`` is a single pointer compare (and rejects
+    bools, which are not sizes).
+    """
+    if type(value) is not int:
+        raise InvalidDataError(obj=value, expected_type='int', operation=operation, reason=f'"{name}" must be an integer')
+    if value <= 0:
+        raise MatrixValueError(value=value, operation=operation, reason=f'"{name}" must be greater than 0')
+
+
 class MatrixFactoryMixin:
+    @classmethod
+    def _unchecked(cls, data: list[list[Any]]) -> Self:
+        """Internal fast constructor.
+
+        Trusts that ``data`` is a freshly built, rectangular, non-empty list
+        of lists and skips the validation and defensive copying done by
+        ``__init__``. Only for use by factory methods that construct the
+        rows themselves.
+        """
+        matrix = cls.__new__(cls)
+        matrix._rows = len(data)
+        matrix._cols = len(data[0])
+        matrix._shape = (matrix._rows, matrix._cols)
+        matrix._data = data
+        return matrix
+
     @classmethod
     def identity(cls, n: int) -> Self:
         """
@@ -25,19 +55,12 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.I: Alias of this method.
         """
-        # check if n are integer
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='identity', reason='"n" must be an integer')
-        
-        # check if n are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='identity', reason='"n" must be greater than 0')
+        _validate_positive_int(n, 'n', 'identity')
 
-        return cls([
-            [1 if i==j else 0 
-             for j in range(n)]
-             for i in range(n)
-        ])
+        data = [[0]*n for _ in range(n)]
+        for i in range(n):
+            data[i][i] = 1
+        return cls._unchecked(data)
     
     @classmethod
     def zeros(cls, n: int, m: int | None = None) -> Self:
@@ -58,27 +81,15 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.O: Alias of this method.
         """
-        # check if n and m are integers
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='zeros', reason='"n" must be an integer')
-        if not isinstance(m, int) and m is not None:
-            raise InvalidDataError(obj=m, expected_type='int', operation='zeros', reason='"m" must be an integer')
-
-        # check if n and m are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='zeros', reason='"n" must be greater than 0')
-        if m is not None and m <= 0:
-            raise MatrixValueError(value=m, operation='zeros', reason='"m" must be greater than 0')
+        _validate_positive_int(n, 'n', 'zeros')
+        if m is not None:
+            _validate_positive_int(m, 'm', 'zeros')
         
         # shorthand for square zero matrix
         if m is None:
             m = n
 
-        return cls([
-            [0 
-             for j in range(m)]
-             for i in range(n)
-        ])
+        return cls._unchecked([[0]*m for _ in range(n)])
     
     @classmethod
     def ones(cls, n: int, m: int | None = None) -> Self:
@@ -99,27 +110,15 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.J: Alias of this method.
         """
-        # check if n and m are integers
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='ones', reason='"n" must be an integer')
-        if not isinstance(m, int) and m is not None:
-            raise InvalidDataError(obj=m, expected_type='int', operation='ones', reason='"m" must be an integer')
-
-        # check if n and m are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='ones', reason='"n" must be greater than 0')
-        if m is not None or m <= 0:
-            raise MatrixValueError(value=m, operation='ones', reason='"m" must be greater than 0')
+        _validate_positive_int(n, 'n', 'ones')
+        if m is not None:
+            _validate_positive_int(m, 'm', 'ones')
         
         # shorthand for square zero matrix
         if m is None:
             m = n
         
-        return cls([
-            [1
-             for j in range(m)]
-             for i in range(n)
-        ])
+        return cls._unchecked([[1]*m for _ in range(n)])
 
     @classmethod
     def exchange(cls, n: int) -> Self:
@@ -138,19 +137,12 @@ class MatrixFactoryMixin:
             InvalidDataError: If ``n`` is not an integer.
             MatrixValueError: If ``n`` is less than or equal to 0.
         """
-        # check if n are integer
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='exchange', reason='"n" must be an integer')
-        
-        # check if n are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='exchange', reason='"n" must be greater than 0')
+        _validate_positive_int(n, 'n', 'exchange')
 
-        return cls([
-            [1 if i+j==n-1 else 0 
-             for j in range(n)]
-             for i in range(n)
-        ])
+        data = [[0]*n for _ in range(n)]
+        for i in range(n):
+            data[i][n-1-i] = 1
+        return cls._unchecked(data)
     
     @classmethod
     def hilbert(cls, n: int) -> Self:
@@ -173,18 +165,13 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.H: Alias of this method.
         """
-        # check if n are integer
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='hilbert', reason='"n" must be an integer greater than 0')
-
-        # check if n are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='hilbert', reason='"n" must be greater than 0')
-
-        return cls([
-            [1/(i+j-1) 
-             for j in range(1, n+1)]
-             for i in range(1, n+1)
+        _validate_positive_int(n, 'n', 'hilbert')
+
+        # entries only depend on i+j: n divisions instead of n^2
+        inv = [1/k for k in range(1, 2*n)]
+        return cls._unchecked([
+            inv[i:i+n]
+            for i in range(n)
         ])
 
     @classmethod
@@ -206,13 +193,22 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.E: Alias of this method.
         """
+        _validate_positive_int(n, 'n', 'matrix_unit')
+        if m is not None:
+            _validate_positive_int(m, 'm', 'matrix_unit')
+
         if m is None:
             m = n
-        
-        matrix = cls.zeros(n, m)
-        matrix[i, j] = 1
 
-        return matrix
+        # check if i and j are within bounds
+        if not 1 <= i <= n:
+            raise IndexOutOfBoundsError(index=i, axis='row', operation='matrix_unit', reason='"i" is out of bounds')
+        if not 1 <= j <= m:
+            raise IndexOutOfBoundsError(index=j, axis='col', operation='matrix_unit', reason='"j" is out of bounds')
+
+        data = [[0]*m for _ in range(n)]
+        data[i-1][j-1] = 1
+        return cls._unchecked(data)
 
     @classmethod
     def diagonal(cls, diagonals: list[Any], n: int | None = None, m: int | None = None) -> Self:
@@ -241,11 +237,13 @@ class MatrixFactoryMixin:
         if n is None:
             n = len(diagonals)
         
-        return cls([
-            [diagonals[i] if (i==j and (i < len(diagonals)) and (j < len(diagonals))) else 0
-             for j in range(n)]
-             for i in range(m)
-        ])
+        # fill with zeros in one pass, then write the diagonal in O(n)
+        data = [[0]*n for _ in range(m)]
+        for i, entry in enumerate(diagonals):
+            if i >= m or i >= n:
+                break
+            data[i][i] = entry
+        return cls._unchecked(data)
     
     @classmethod
     def vandermonde(cls, x: list[Any]) -> Self:
@@ -271,11 +269,15 @@ class MatrixFactoryMixin:
         if not isinstance(x, list) or not x:
             raise InvalidDataError(obj=x, expected_type='list', operation='vandermonde', reason='"x" must be an non-empty list')
         
-        return cls([
-            [x[i]**j
-            for j in range(len(x))]
-            for i in range(len(x))
-        ])
+        # build each row by running products: V[i,j] = V[i,j-1] * x[i]
+        n = len(x)
+        data = []
+        for sample in x:
+            row = [1]*n
+            for j in range(1, n):
+                row[j] = row[j-1]*sample
+            data.append(row)
+        return cls._unchecked(data)
  
      
     @classmethod
@@ -302,21 +304,22 @@ class MatrixFactoryMixin:
         See Also:
             Matrix.F: Alias of this method.
         """
-        # check if n are integer
-        if not isinstance(n, int):
-            raise InvalidDataError(obj=n, expected_type='int', operation='fourier', reason='"n" must be an integer')
-        
-        # check if n are greater than 0
-        if n <= 0:
-            raise MatrixValueError(value=n, operation='fourier', reason='"n" must be greater than 0')
+        _validate_positive_int(n, 'n', 'fourier')
 
         # primitive n-th root of unity
         ω = exp(-2*pi*imag / n)
 
-        F = cls.vandermonde([ω**i for i in range(n)])
-        if scale: # make unitary
-            F = F * 1/sqrt(n)
-        return F
+        # only n distinct entries exist: ω^0 .. ω^(n-1), since ω^n = 1
+        roots = [1]*n
+        for k in range(1, n):
+            roots[k] = roots[k-1]*ω
+
+        scaling = 1/sqrt(n) if scale else 1 # make unitary
+        return cls._unchecked([
+            [roots[(i*j) % n]*scaling
+             for j in range(n)]
+             for i in range(n)
+        ])
     
     @classmethod
     def row_vector(cls, componetnts: list[Any], len: int=0) -> Self:
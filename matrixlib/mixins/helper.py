@@ -29,22 +29,33 @@ class HelperMixin:
         if not self._have_same_size(other):
             return False
         
-        eps = type(self).eps()
-        rows, cols = self.rows, self.cols
-
+        # iterate the stored rows directly instead of bounds-checked getitem
         if self._is_floats_matrix() and other._is_floats_matrix():
-            return all(abs(self[i,j]-other[i,j]) <= eps for i in range(1, rows+1) for j in range( 1, cols+1))
-            
-        return all(self[i,j] == other[i,j] for i in range(1, rows+1) for j in range( 1, cols+1))
+            eps = type(self).eps()
+            return all(abs(a-b) <= eps
+                       for row_a, row_b in zip(self._data, other._data)
+                       for a, b in zip(row_a, row_b))
+
+        return all(a == b
+                   for row_a, row_b in zip(self._data, other._data)
+                   for a, b in zip(row_a, row_b))
     
     # === NoName ===
     def _is_square(self) -> bool:
         return self.rows == self.cols
     
     def _is_boolean_matrix(self) -> bool:
-        return all([isinstance(entry, bool) for entry in self])
+        # generator form short-circuits on the first non-bool entry
+        return all(isinstance(entry, bool) for entry in self)
     
     def _is_integer_matrix(self) -> bool:
+        # cached because __str__ re-runs this scan on every print
+        cached = self.__dict__.get('_is_integer_cache')
+        if cached is None:
+            cached = self.__dict__['_is_integer_cache'] = self._compute_is_integer_matrix()
+        return cached
+
+    def _compute_is_integer_matrix(self) -> bool:
         if all(isinstance(entry, int) for entry in self):
             return True
         if all(isinstance(entry, float | int) for entry in self):
@@ -54,25 +65,33 @@ class HelperMixin:
     
     def _is_floats_matrix(self) -> bool:
         return all(isinstance(entry, float | int) for entry in self)
+
+    def _is_numeric_matrix(self) -> bool:
+        return all(isinstance(entry, int | float | complex) for entry in self)
     
     # === Helpers ===
     def _validate_other_type(self, other, *, operation: str = "<unspecified>", reason: str = 'Operand must be an "Matrix"') -> None:
-        if not isinstance(other, type(self)):
-            raise InvalidDataError(
-                obj=other,
-                expected_type=type(self).__name__,
-                operation=operation,
-                reason=reason,
-            )
-        
+        # happy path first: exact type match is a single pointer compare
+        cls = self.__class__
+        if other.__class__ is cls or isinstance(other, cls):
+            return
+        raise InvalidDataError(
+            obj=other,
+            expected_type=cls.__name__,
+            operation=operation,
+            reason=reason,
+        )
+
     def _validate_same_size(self, other: Self, *, operation: str = "<unspecified>", reason: str = "Matrices have different dimensions") -> None:
-        if not self._have_same_size(other):
-            raise InvalidDimensionsError(
-                first=self,
-                second=other,
-                operation=operation,
-                reason=reason,
-            )
+        # compare the stored attributes directly instead of a method call
+        if self._rows == other._rows and self._cols == other._cols:
+            return
+        raise InvalidDimensionsError(
+            first=self,
+            second=other,
+            operation=operation,
+            reason=reason,
+        )
 
     def _validate_boolean_matrix(self, *, operation: str = "<unspecified>", reason: str = "Operand is not a boolean matrix") -> None:
         if not self._is_boolean_matrix():
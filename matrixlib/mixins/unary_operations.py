@@ -20,16 +20,46 @@ class UnaryMatrixOperationsMixin:
             Matrix.det: Alias of this method.
 
         Notes:
-            The determinant is calculated using Laplace expansion along the first row.
+            Numeric matrices of size 4×4 and up use Gaussian elimination with
+            partial pivoting (O(n³)). Smaller and symbolic matrices use
+            Laplace expansion along the first row.
         """
         if not self._is_square():
             raise NotSquareError(matrix=self, operation='determinant')
-        
+
+        # memoized per instance; __setitem__ drops the cache on mutation
+        cached = self.__dict__.get('_det_cache')
+        if cached is not None:
+            return cached
+
+        # closed forms for the common tiny sizes (also the base cases the
+        # Laplace expansion bottoms out in)
         if self.rows == 1:
-            return self[1,1]
-        
-        # Laplace expansion
-        return sum(self[1,j]*self.C(1,j) for j in range(1, self.cols+1))
+            det = self._data[0][0]
+        elif self.rows == 2:
+            (a, b), (c, d) = self._data
+            det = a*d - b*c
+        elif self.rows == 3:
+            (a, b, c), (d, e, f), (g, h, i) = self._data
+            det = a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g)
+        # pivoting needs abs() comparisons, so only numeric entries qualify
+        elif self.rows >= 4 and self._is_numeric_matrix():
+            factored = self._lu_cached()
+            if factored is None: # singular
+                det = 0
+            else:
+                _, upper, _, sign = factored
+                det = sign
+                for k in range(self.rows):
+                    det *= upper[k][k]
+        else:
+            # non-numeric (e.g. symbolic) matrices cannot pivot, but the
+            # iterative subset DP is division-free and O(n·2^n) instead of
+            # the factorial cofactor recursion
+            det = _det_dp(self._data)
+
+        self.__dict__['_det_cache'] = det
+        return det
 
     def trace(self):
         """
@@ -47,7 +77,8 @@ class UnaryMatrixOperationsMixin:
         if not self._is_square():
             raise NotSquareError(matrix=self, operation="trace")
         
-        return sum(self[i,i] for i in range(1, self.rows+1))
+        # walk the stored rows once; enumerate supplies the diagonal index
+        return sum(row[i] for i, row in enumerate(self._data))
 
     def transpose(self):
         """
@@ -59,11 +90,8 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.T: Alias of this method.
         """
-        return self.__class__([
-             [self[row,col]
-              for row in range(1, self.rows+1)] 
-              for col in range(1, self.cols+1)
-        ])
+        # zip(*rows) does the whole transposition in C
+        return type(self)._unchecked([list(col) for col in zip(*self._data)])
 
     def hermitian_transpose(self):
         """
@@ -75,12 +103,13 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.H: Alias of this method.
         """
-        # z conjugate = |z|^2 / z
-        return self.__class__([
-             [self[i,j]-self[i,j] if abs(self[i,j]) < 1e-8 else abs(self[i,j])*abs(self[i,j]) / self[i,j]
-              for j in range(1, self.cols+1)] 
-              for i in range(1, self.rows+1)
-        ]).T
+        # conjugate and transpose in a single pass; int/float/complex (and
+        # symbolic) entries all provide .conjugate()
+        return type(self)._unchecked([
+            [entry.conjugate() if hasattr(entry, 'conjugate') else entry
+             for entry in col]
+             for col in zip(*self._data)
+        ])
 
     def submatrix(self, rows: list[int], cols: list[int]):
         """ 
@@ -98,26 +127,56 @@ class UnaryMatrixOperationsMixin:
             IndexOutOfBoundsError: If any index in ``rows`` or ``cols`` is out of bounds.
             InvalidDimensionsError: If the resulting submatrix is empty (no rows or no columns).
         """
-        # check if rows and cols are lists of integers
-        if not isinstance(rows, list) or not all(isinstance(i, int) for i in rows) or not rows:
+        # type and bounds checks fused into one pass per index list
+        if not isinstance(rows, list) or not rows:
             raise InvalidDataError(obj=rows, expected_type='list[int]', operation='submatrix', reason='"rows" must be a list of integers')
-        if not isinstance(cols, list) or not all(isinstance(j, int) for j in cols) or not cols:
+        if not isinstance(cols, list) or not cols:
             raise InvalidDataError(obj=cols, expected_type='list[int]', operation='submatrix', reason='"cols" must be a list of integers')
-
-        # check if rows and cols are within bounds
-        if any(i-1 not in range(self.rows) for i in rows):
-            raise IndexOutOfBoundsError(matrix=self, index=rows, axis='row', operation='submatrix', reason='An index in "rows" is out of bounds')
-        if any(j-1 not in range(self.cols) for j in cols):
-            raise IndexOutOfBoundsError(matrix=self, index=cols, axis='col', operation='submatrix', reason='An index in "cols" is out of bounds')
+        n_rows, n_cols = self.rows, self.cols
+        for i in rows:
+            if not isinstance(i, int):
+                raise InvalidDataError(obj=rows, expected_type='list[int]', operation='submatrix', reason='"rows" must be a list of integers')
+            if not 1 <= i <= n_rows:
+                raise IndexOutOfBoundsError(matrix=self, index=rows, axis='row', operation='submatrix', reason='An index in "rows" is out of bounds')
+        for j in cols:
+            if not isinstance(j, int):
+                raise InvalidDataError(obj=cols, expected_type='list[int]', operation='submatrix', reason='"cols" must be a list of integers')
+            if not 1 <= j <= n_cols:
+                raise IndexOutOfBoundsError(matrix=self, index=cols, axis='col', operation='submatrix', reason='An index in "cols" is out of bounds')
+
+        return self._submatrix_unchecked(rows, cols)
+
+    def _submatrix_unchecked(self, rows: list[int], cols: list[int]):
+        """Build a submatrix from already validated 1-based index lists.
+
+        Internal callers (``minor`` and friends) generate the index lists
+        themselves, so the public validation pass would be wasted work.
+        """
+        # internally generated complements can still be empty (a minor that
+        # excludes every row or column); fail with the library's error
+        # instead of letting the slicing below raise a bare IndexError
+        if not rows:
+            raise InvalidDataError(obj=rows, expected_type='list[int]', operation='submatrix', reason='"rows" must be a non-empty list of indices')
+        if not cols:
+            raise InvalidDataError(obj=cols, expected_type='list[int]', operation='submatrix', reason='"cols" must be a non-empty list of indices')
 
         # remove duplicates and sort
-        rows = sorted(list(set(rows)))
-        cols = sorted(list(set(cols)))
-
-        return self.__class__([
-             [self[r,c]
-              for c in cols] 
-              for r in rows
+        rows = sorted(set(rows))
+        cols = sorted(set(cols))
+
+        # contiguous index ranges (common for blocks and minors) reduce to
+        # one C-level slice per row
+        if (rows[-1] - rows[0] + 1 == len(rows)
+                and cols[-1] - cols[0] + 1 == len(cols)):
+            c0, c1 = cols[0]-1, cols[-1]
+            return type(self)._unchecked([
+                row[c0:c1] for row in self._data[rows[0]-1:rows[-1]]
+            ])
+
+        data = self._data
+        return type(self)._unchecked([
+             [row[c-1] for c in cols]
+             for row in (data[r-1] for r in rows)
         ])
 
     def minor(self, rows: list[int], cols: list[int]):
@@ -144,15 +203,27 @@ class UnaryMatrixOperationsMixin:
             raise InvalidDataError(matrix=cols, expected_type='list[int]', operation='minor', reason='"cols" must be a list of integers')
 
         # check if rows and cols are within bounds
-        if any(i-1 not in range(self.rows) for i in rows):
+        if any(not 1 <= i <= self.rows for i in rows):
             raise IndexOutOfBoundsError(matrix=self, index=rows, axis='row', operation='minor', reason='An index in "rows" is out of bounds')
-        if any(j-1 not in range(self.cols) for j in cols):
+        if any(not 1 <= j <= self.cols for j in cols):
             raise IndexOutOfBoundsError(matrix=self, index=cols, axis='col', operation='minor', reason='An index in "cols" is out of bounds')
 
-        return self.submatrix(
-            [row for row in range(1, self.rows+1) if row not in rows], 
-            [col for col in range(1, self.cols+1) if col not in cols]
+        # set lookups make the complement filter a single O(n) pass
+        rset, cset = set(rows), set(cols)
+
+        # cofactor expansions re-request the same minors; memoize by the
+        # excluded index sets (invalidated by __setitem__ on mutation)
+        key = (tuple(sorted(rset)), tuple(sorted(cset)))
+        cache = self.__dict__.setdefault('_minor_cache', {})
+        if key in cache:
+            return cache[key]
+
+        value = self._submatrix_unchecked(
+            [row for row in range(1, self.rows+1) if row not in rset],
+            [col for col in range(1, self.cols+1) if col not in cset]
         ).det
+        cache[key] = value
+        return value
 
     def first_minor(self, i: int, j: int):
         """
@@ -174,7 +245,26 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.M: Alias of this method.
         """
-        return self.minor([i], [j])
+        # single row/column exclusion is what every cofactor asks for: two
+        # slices per kept row assemble the reduced matrix directly, skipping
+        # minor's general validation and complement machinery
+        if (type(i) is not int or type(j) is not int
+                or not 1 <= i <= self.rows or not 1 <= j <= self.cols
+                or self.rows <= 1 or self.cols <= 1):
+            return self.minor([i], [j]) # full validation and error reporting
+
+        key = ((i,), (j,))
+        cache = self.__dict__.setdefault('_minor_cache', {})
+        if key in cache:
+            return cache[key]
+
+        skip = i-1
+        value = type(self)._unchecked([
+            row[:j-1] + row[j:]
+            for r, row in enumerate(self._data) if r != skip
+        ]).det
+        cache[key] = value
+        return value
 
     def cofactor(self, i: int, j: int):
         """
@@ -203,7 +293,9 @@ class UnaryMatrixOperationsMixin:
         if not isinstance(j, int):
             raise InvalidDataError(obj=j, expected_type='int', operation='cofactor', reason='"j" must be an integer')
 
-        return (-1)**(i+j) * self.M(i, j)
+        # parity test replaces the integer power (-1)**(i+j)
+        sign = -1 if (i+j) & 1 else 1
+        return sign * self.M(i, j)
 
     def cofactor_matrix(self):
         """
@@ -219,11 +311,8 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.comatrix: Alias of this method.
         """
-        return self.__class__([
-            [self.C(i,j) 
-             for j in range(1, self.cols+1)]
-             for i in range(1, self.rows+1)
-        ])
+        # reuses (and fills) the memoized adjugate
+        return self.adjugate_matrix().T
 
     def adjugate_matrix(self):
         """
@@ -238,8 +327,99 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.adj: Alias of this method.
         """
-        return self.cofactor_matrix().T
+        cached = self.__dict__.get('_adj_cache')
+        if cached is not None:
+            return cached
+
+        adj = self._adjugate_lu()
+        if adj is None:
+            if self.rows >= 4 and self._is_square() and self._is_numeric_matrix():
+                # numeric but singular: LU cannot help, but the
+                # Faddeev-LeVerrier recursion still applies
+                adj = self._adjugate_faddeev()
+            else:
+                adj = self._cofactor_matrix_laplace().T
+
+        self.__dict__['_adj_cache'] = adj
+        return adj
+
+    def _cofactor_matrix_laplace(self):
+        """Per-entry cofactor fallback (small, symbolic or singular matrices)."""
+        # checkerboard sign carried by two alternating locals instead of a
+        # parity computation (or power) per cell
+        rows, cols, M = self.rows, self.cols, self.M
+        data = []
+        row_sign = 1
+        for i in range(1, rows+1):
+            sign = row_sign
+            row = []
+            for j in range(1, cols+1):
+                row.append(sign * M(i, j))
+                sign = -sign
+            data.append(row)
+            row_sign = -row_sign
+        return self.__class__(data)
+
+    def _lu_cached(self):
+        """Memoized LUP factorization, shared by det, adjugate and inverse.
+
+        ``None`` (a singular matrix) is cached too; __setitem__ drops the
+        entry on mutation like the other instance caches.
+        """
+        try:
+            return self.__dict__['_lu_cache']
+        except KeyError:
+            factored = self.__dict__['_lu_cache'] = _lu_factor(self._data, type(self).eps())
+            return factored
+
+    def _adjugate_lu(self):
+        """Adjugate from one LU factorization, or ``None`` when not applicable.
+
+        Solves ``A·X = det(A)·I`` column by column, reusing the factorization
+        across all n² entries instead of expanding n² independent minors.
+        Returns ``None`` for small, symbolic or singular matrices so callers
+        can fall back to the Laplace path.
+        """
+        if not (self.rows >= 4 and self._is_square() and self._is_numeric_matrix()):
+            return None
+
+        factored = self._lu_cached()
+        if factored is None: # singular
+            return None
+
+        lower, upper, perm, sign = factored
+        n = self.rows
+        det = sign
+        for k in range(n):
+            det *= upper[k][k]
+
+        rhs_columns = [[det if i == j else 0 for i in range(n)] for j in range(n)]
+        solution_columns = _lu_solve_columns(lower, upper, perm, rhs_columns)
+        # column j of the adjugate is the solution for det·e_j
+        return self.__class__([list(row) for row in zip(*solution_columns)])
     
+    def _adjugate_faddeev(self):
+        """Adjugate via the Faddeev-LeVerrier recursion.
+
+        ``M₁ = I``, ``cₖ = -tr(A·Mₖ)/k``, ``Mₖ₊₁ = A·Mₖ + cₖ·I`` and
+        ``adj(A) = (-1)ⁿ⁻¹·Mₙ``. Needs no pivoting or division by matrix
+        entries, so it works where the matrix is singular — O(n⁴) from the
+        n matrix products, against n² expanded minors for Laplace.
+        """
+        n = self.rows
+        identity = type(self).identity(n)
+        M = identity
+        for k in range(1, n):
+            AM = self * M
+            tr = AM.tr
+            # cₖ is an exact integer for integer matrices; keep it one
+            if isinstance(tr, int) and tr % k == 0:
+                c = -(tr // k)
+            else:
+                c = -tr / k
+            M = AM + c*identity
+        return M if (n-1) % 2 == 0 else -M
+
     def inverse_matrix(self):
         """
         Return the inverse of the matrix.
@@ -254,12 +434,45 @@ class UnaryMatrixOperationsMixin:
         See Also:
             Matrix.inv: Alias of this method.
         """
-        # check if the inverse exists 
-        determinant = self.det
-        if isinstance(determinant, int | float | complex) and abs(determinant) < 1e-8:
-            raise SingularMatrixError(matrix=self, operation='inverse')
-        
-        return self.adj * (1/determinant)
+        cached = self.__dict__.get('_inv_cache')
+        if cached is not None:
+            return cached
+
+        # one factorization + n column solves of A·X = I replaces the two
+        # independent adjugate and determinant passes
+        if self._is_square() and self.rows >= 4 and self._is_numeric_matrix():
+            factored = self._lu_cached()
+            if factored is None:
+                raise SingularMatrixError(matrix=self, operation='inverse')
+            lower, upper, perm, _ = factored
+            n = self.rows
+            basis_columns = [[1 if i == j else 0 for i in range(n)] for j in range(n)]
+            solution_columns = _lu_solve_columns(lower, upper, perm, basis_columns)
+            inv = self.__class__([list(row) for row in zip(*solution_columns)])
+        else:
+            # small or symbolic: adjugate over determinant
+            determinant = self.det
+            if isinstance(determinant, int | float | complex) and abs(determinant) < 1e-8:
+                raise SingularMatrixError(matrix=self, operation='inverse')
+            # analytic adjugates for the tiny sizes, register arithmetic only
+            if self.rows == 1:
+                inv = self.__class__([[1/determinant]])
+            elif self.rows == 2:
+                (a, b), (c, d) = self._data
+                inv = self.__class__([[d, -b], [-c, a]]) * (1/determinant)
+            elif self.rows == 3:
+                (a, b, c), (d, e, f), (g, h, i) = self._data
+                adj = self.__class__([
+                    [e*i - f*h, c*h - b*i, b*f - c*e],
+                    [f*g - d*i, a*i - c*g, c*d - a*f],
+                    [d*h - e*g, b*g - a*h, a*e - b*d],
+                ])
+                inv = adj * (1/determinant)
+            else:
+                inv = self.adj * (1/determinant)
+
+        self.__dict__['_inv_cache'] = inv
+        return inv
 
     
     # === Aliases ===
@@ -272,3 +485,89 @@ class UnaryMatrixOperationsMixin:
     comatrix = property(cofactor_matrix)
     adj = property(adjugate_matrix)
     inv = property(inverse_matrix)
+
+
+# === utils ===
+def _lu_factor(data, eps):
+    """LUP factorization ``P·A = L·U`` with partial pivoting.
+
+    Returns ``(lower, upper, perm, sign)`` where ``perm`` maps factored row
+    positions to original rows, or ``None`` if a pivot falls below ``eps``
+    (singular matrix).
+    """
+    n = len(data)
+    upper = [list(row) for row in data]
+    lower = [[0]*n for _ in range(n)]
+    perm = list(range(n))
+    sign = 1
+    for k in range(n):
+        pivot_row = max(range(k, n), key=lambda r: abs(upper[r][k]))
+        if abs(upper[pivot_row][k]) < eps:
+            return None
+        if pivot_row != k:
+            upper[k], upper[pivot_row] = upper[pivot_row], upper[k]
+            lower[k], lower[pivot_row] = lower[pivot_row], lower[k]
+            perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+            sign = -sign
+        row_k = upper[k]
+        pivot = row_k[k]
+        lower[k][k] = 1
+        for i in range(k+1, n):
+            row_i = upper[i]
+            factor = row_i[k]/pivot
+            lower[i][k] = factor
+            row_i[k] = 0
+            for j in range(k+1, n):
+                row_i[j] -= factor*row_k[j]
+    return lower, upper, perm, sign
+
+
+def _det_dp(data):
+    """Determinant by dynamic programming over column subsets.
+
+    ``dp[S]`` holds the determinant of the first ``|S|`` rows restricted to
+    the column set ``S`` (encoded as a bitmask). Each row extends every
+    surviving subset by one unused column with the appropriate cofactor
+    sign. O(n·2ⁿ) time, no divisions and no pivoting, so it works for any
+    entry type that supports ``+``/``*`` — including symbolic expressions —
+    and stays exact for integers.
+    """
+    n = len(data)
+    dp = {0: 1}
+    for k, row in enumerate(data):
+        # expanding along row k (the last row so far): sign = (-1)^(k+pos)
+        row_sign = -1 if k & 1 else 1
+        new = {}
+        for mask, val in dp.items():
+            sign = row_sign
+            for j, entry in enumerate(row):
+                bit = 1 << j
+                if mask & bit:
+                    sign = -sign
+                elif entry != 0: # a zero entry contributes nothing
+                    key = mask | bit
+                    term = sign * entry * val
+                    if key in new:
+                        new[key] = new[key] + term
+                    else:
+                        new[key] = term
+        dp = new
+    return dp.get((1 << n) - 1, 0)
+
+
+def _lu_solve_columns(lower, upper, perm, rhs_columns):
+    """Solve ``A·x = b`` for every column ``b`` given ``P·A = L·U``."""
+    n = len(lower)
+    solutions = []
+    for b in rhs_columns:
+        # forward substitution: L·y = P·b
+        y = [0]*n
+        for i in range(n):
+            y[i] = b[perm[i]] - sum(lower[i][j]*y[j] for j in range(i))
+        # back substitution: U·x = y
+        x = [0]*n
+        for i in range(n-1, -1, -1):
+            x[i] = (y[i] - sum(upper[i][j]*x[j] for j in range(i+1, n))) / upper[i][i]
+        solutions.append(x)
+    return solutions
+